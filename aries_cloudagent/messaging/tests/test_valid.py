@@ -36,6 +36,7 @@ from ..valid import (
     SHA256,
     UUID4,
     WHOLE_NUM,
+    OneOfSet,
 )
 
 
@@ -522,3 +523,16 @@ class TestValid(TestCase):
         CREDENTIAL_CONTEXT["validate"](
             ["https://www.w3.org/2018/credentials/v1", "https://some-other-context.com"]
         )
+
+    def test_one_of_set(self):
+        validator = OneOfSet(["true", "false"])
+        assert validator.choices == ["true", "false"]
+
+        with self.assertRaises(ValidationError):
+            validator("maybe")
+
+        with self.assertRaises(ValidationError):
+            validator({})  # unhashable
+
+        assert validator("true") == "true"
+        assert validator("false") == "false"
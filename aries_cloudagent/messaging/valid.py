@@ -267,6 +267,27 @@ class DIDWeb(Regexp):
         )
 
 
+class OneOfSet(OneOf):
+    """Validate value against fixed choices by set membership."""
+
+    def __init__(self, choices, **kwargs):
+        """Initializer."""
+
+        super().__init__(choices, **kwargs)
+        self.choice_set = frozenset(self.choices)
+
+    def __call__(self, value):
+        """Validate input value."""
+
+        try:
+            if value not in self.choice_set:
+                raise ValidationError(self._format_error(value))
+        except TypeError as error:
+            raise ValidationError(self._format_error(value)) from error
+
+        return value
+
+
 class DIDPosture(OneOf):
     """Validate value against defined DID postures."""
 
@@ -177,7 +177,7 @@ class DIFPresFormatHandler(V30PresFormatHandler):
     async def create_pres(
         self,
         pres_ex_record: V30PresExRecord,
-        request_data: dict = {},
+        request_data: dict = None,
     ) -> Tuple[V30PresFormat, AttachDecorator]:
         """Create a presentation."""
         proof_request_atch = pres_ex_record.pres_request.attachments
@@ -192,7 +192,7 @@ class DIFPresFormatHandler(V30PresFormatHandler):
         reveal_doc_frame = None
         challenge = None
         domain = None
-        if request_data != {} and DIFPresFormatHandler.format.api in request_data:
+        if request_data and DIFPresFormatHandler.format.api in request_data:
             dif_spec = request_data.get(DIFPresFormatHandler.format.api)
             pres_spec_payload = DIFPresSpecSchema().load(dif_spec)
             # Overriding with prover provided pres_spec
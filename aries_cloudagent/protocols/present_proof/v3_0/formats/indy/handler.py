@@ -1,13 +1,14 @@
 """V3.0 present-proof indy presentation-exchange format handler."""
 
-import json
 import logging
 
 
-from typing import Mapping, Tuple
+from functools import lru_cache
+from typing import Mapping, Optional, Sequence, Tuple
 from marshmallow import RAISE
 
 
+from ......core.profile import Profile
 from ......indy.holder import IndyHolder
 from ......indy.models.predicate import Predicate
 from ......indy.models.proof import IndyProofSchema
@@ -34,12 +35,166 @@ from ..handler import V30PresFormatHandler, V30PresFormatHandlerError
 
 LOGGER = logging.getLogger(__name__)
 
+INDY_API = V30PresFormat.Format.INDY.api
+
+
+@lru_cache(maxsize=16)
+def _predicate(p_type: str) -> Optional[Predicate]:
+    """Return predicate enum for relation string, memoized."""
+    return Predicate.get(p_type)
+
+
+def _identifier_criteria(identifier: Mapping) -> dict:
+    """Return restriction criteria for a presentation sub-proof identifier."""
+    schema_id = identifier["schema_id"]
+    cred_def_id = identifier["cred_def_id"]
+    schema_id_parts = schema_id.split(":")
+    return {
+        "schema_id": schema_id,
+        "schema_issuer_did": schema_id_parts[-4],
+        "schema_name": schema_id_parts[-2],
+        "schema_version": schema_id_parts[-1],
+        "cred_def_id": cred_def_id,
+        "issuer_did": cred_def_id.split(":")[-5],
+    }
+
+
+def _restriction_matches(restriction: Mapping, criteria: Mapping) -> bool:
+    """Return whether every restriction key-value pair appears in criteria."""
+    return all(k in criteria and criteria[k] == v for k, v in restriction.items())
+
+
+def _satisfies_restrictions(restrictions: Sequence[Mapping], criteria: Mapping) -> bool:
+    """Return whether criteria satisfy any of the restrictions, if there are any."""
+    return not restrictions or any(
+        _restriction_matches(restriction, criteria) for restriction in restrictions
+    )
+
+
+def _check_proof_vs_proposal(proof: Mapping, proof_req: Mapping):
+    """Check for bait and switch in presented values vs. proposal request."""
+    identifier_criteria = [
+        _identifier_criteria(identifier) for identifier in proof["identifiers"]
+    ]
+
+    # revealed attrs
+    for reft, attr_spec in proof["requested_proof"]["revealed_attrs"].items():
+        proof_req_attr_spec = proof_req["requested_attributes"].get(reft)
+        if not proof_req_attr_spec:
+            raise V30PresFormatHandlerError(
+                f"Presentation referent {reft} not in proposal request"
+            )
+        req_restrictions = proof_req_attr_spec.get("restrictions", {})
+
+        name = proof_req_attr_spec["name"]
+        proof_value = attr_spec["raw"]
+        criteria = {
+            **identifier_criteria[attr_spec["sub_proof_index"]],
+            f"attr::{name}::value": proof_value,
+        }
+
+        if not _satisfies_restrictions(req_restrictions, criteria):
+            raise V30PresFormatHandlerError(
+                f"Presented attribute {reft} does not satisfy proof request "
+                f"restrictions {req_restrictions}"
+            )
+
+    # revealed attr groups
+    for reft, attr_spec in (
+        proof["requested_proof"].get("revealed_attr_groups", {}).items()
+    ):
+        proof_req_attr_spec = proof_req["requested_attributes"].get(reft)
+        if not proof_req_attr_spec:
+            raise V30PresFormatHandlerError(
+                f"Presentation referent {reft} not in proposal request"
+            )
+        req_restrictions = proof_req_attr_spec.get("restrictions", {})
+        criteria = dict(identifier_criteria[attr_spec["sub_proof_index"]])
+        criteria.update(
+            (f"attr::{name}::value", values["raw"])
+            for name, values in attr_spec["values"].items()
+        )
+
+        if not _satisfies_restrictions(req_restrictions, criteria):
+            raise V30PresFormatHandlerError(
+                f"Presented attr group {reft} does not satisfy proof request "
+                f"restrictions {req_restrictions}"
+            )
+
+    # predicate bounds
+    for reft, pred_spec in proof["requested_proof"]["predicates"].items():
+        proof_req_pred_spec = proof_req["requested_predicates"].get(reft)
+        if not proof_req_pred_spec:
+            raise V30PresFormatHandlerError(
+                f"Presentation referent {reft} not in proposal request"
+            )
+        req_name = proof_req_pred_spec["name"]
+        req_pred = _predicate(proof_req_pred_spec["p_type"])
+        req_value = proof_req_pred_spec["p_value"]
+        # let indy-sdk reject attribute value mismatch here
+        req_restrictions = [
+            {k: v for k, v in req_restriction.items() if not k.startswith("attr::")}
+            for req_restriction in proof_req_pred_spec.get("restrictions", {})
+        ]
+        sub_proof_index = pred_spec["sub_proof_index"]
+        canon_req_name = canon(req_name)
+        for ge_proof in proof["proof"]["proofs"][sub_proof_index]["primary_proof"][
+            "ge_proofs"
+        ]:
+            proof_pred_spec = ge_proof["predicate"]
+            if proof_pred_spec["attr_name"] != canon_req_name:
+                continue
+            if not (
+                _predicate(proof_pred_spec["p_type"]) is req_pred
+                and proof_pred_spec["value"] == req_value
+            ):
+                raise V30PresFormatHandlerError(
+                    f"Presentation predicate on {req_name} "
+                    "mismatches proposal request"
+                )
+            break
+        else:
+            raise V30PresFormatHandlerError(
+                f"Proposed request predicate on {req_name} not in presentation"
+            )
+
+        criteria = identifier_criteria[sub_proof_index]
+
+        if not _satisfies_restrictions(req_restrictions, criteria):
+            raise V30PresFormatHandlerError(
+                f"Presented predicate {reft} does not satisfy proof request "
+                f"restrictions {req_restrictions}"
+            )
+
 
 class IndyPresExchangeHandler(V30PresFormatHandler):
     """Indy presentation format handler."""
 
     format = V30PresFormat.Format.INDY
 
+    _proof_request_schema = IndyProofRequestSchema(unknown=RAISE)
+    _validation_schemas = {
+        PRES_30_REQUEST: _proof_request_schema,
+        PRES_30_PROPOSAL: _proof_request_schema,
+        PRES_30: IndyProofSchema(unknown=RAISE),
+    }
+    _format_identifiers = {
+        message_type: ATTACHMENT_FORMAT[message_type][INDY_API]
+        for message_type in (PRES_30_REQUEST, PRES_30_PROPOSAL, PRES_30)
+    }
+
+    def __init__(self, profile: Profile):
+        """Initialize indy presentation format handler."""
+        super().__init__(profile)
+        self._indy_handler = None
+
+    @property
+    def indy_handler(self) -> IndyPresExchHandler:
+        """Accessor for indy presentation exchange handler on current profile."""
+        if not self._indy_handler:
+            self._indy_handler = IndyPresExchHandler(self._profile)
+        return self._indy_handler
+
     @classmethod
     def validate_fields(cls, message_type: str, attachment_data: Mapping):
         """Validate attachment data for a specific message type.
@@ -59,17 +214,8 @@ class IndyPresExchangeHandler(V30PresFormatHandler):
             Exception: When the data is not valid.
 
         """
-        mapping = {
-            PRES_30_REQUEST: IndyProofRequestSchema,
-            PRES_30_PROPOSAL: IndyProofRequestSchema,
-            PRES_30: IndyProofSchema,
-        }
-
-        # Get schema class
-        Schema = mapping[message_type]
-
-        # Validate, throw if not valid
-        Schema(unknown=RAISE).load(attachment_data)
+        # Validate against schema shared across calls, throw if not valid
+        cls._validation_schemas[message_type].load(attachment_data)
 
     def get_format_identifier(self, message_type: str) -> str:
         """Get attachment format identifier for format and message combination.
@@ -81,7 +227,7 @@ class IndyPresExchangeHandler(V30PresFormatHandler):
             str: Issue credential attachment format identifier
 
         """
-        return ATTACHMENT_FORMAT[message_type][IndyPresExchangeHandler.format.api]
+        return self._format_identifiers[message_type]
 
     def get_format_data(
         self, message_type: str, data: dict
@@ -93,9 +239,7 @@ class IndyPresExchangeHandler(V30PresFormatHandler):
 
         return (
             format,
-            AttachDecorator.data_base64(
-                data, ident=IndyPresExchangeHandler.format.api, format=format
-            ),
+            AttachDecorator.data_base64(data, ident=INDY_API, format=format),
         )
 
     async def create_bound_request(
@@ -115,13 +259,7 @@ class IndyPresExchangeHandler(V30PresFormatHandler):
             A tuple (updated presentation exchange record, presentation request message)
 
         """
-        indy_proof_request = pres_ex_record.pres_proposal.attachments
-        for att in indy_proof_request:
-            if (
-                V30PresFormat.Format.get(att.format.format).api
-                == V30PresFormat.Format.INDY.api
-            ):
-                indy_proof_request = att.content
+        indy_proof_request = pres_ex_record.indy_attachment("pres_proposal")
         if request_data:
             indy_proof_request["name"] = request_data.get("name", "proof-request")
             indy_proof_request["version"] = request_data.get("version", "1.0")
@@ -143,10 +281,7 @@ class IndyPresExchangeHandler(V30PresFormatHandler):
         requested_credentials = {}
         if not request_data:
             try:
-                proof_request = pres_ex_record.pres_request
-                indy_proof_request = proof_request.attachment(
-                    IndyPresExchangeHandler.format
-                )
+                indy_proof_request = pres_ex_record.indy_attachment("pres_request")
 
                 requested_credentials = (
                     await indy_proof_req_preview2indy_requested_creds(
@@ -168,8 +303,7 @@ class IndyPresExchangeHandler(V30PresFormatHandler):
                     "requested_attributes": indy_spec["requested_attributes"],
                     "requested_predicates": indy_spec["requested_predicates"],
                 }
-        indy_handler = IndyPresExchHandler(self._profile)
-        indy_proof = await indy_handler.return_presentation(
+        indy_proof = await self.indy_handler.return_presentation(
             pres_ex_record=pres_ex_record,
             requested_credentials=requested_credentials,
         )
@@ -178,152 +312,10 @@ class IndyPresExchangeHandler(V30PresFormatHandler):
     async def receive_pres(self, message: V30Pres, pres_ex_record: V30PresExRecord):
         """Receive a presentation and check for presented values vs. proposal request."""
 
-        def _check_proof_vs_proposal():
-            """Check for bait and switch in presented values vs. proposal request."""
-            proof_req = pres_ex_record.pres_request.attachments
-
-            for att in proof_req:
-                if (
-                    V30PresFormat.Format.get(att.format.format).api
-                    == V30PresFormat.Format.INDY.api
-                ):
-                    proof_req = att.content
-
-            # revealed attrs
-            for reft, attr_spec in proof["requested_proof"]["revealed_attrs"].items():
-                proof_req_attr_spec = proof_req["requested_attributes"].get(reft)
-                if not proof_req_attr_spec:
-                    raise V30PresFormatHandlerError(
-                        f"Presentation referent {reft} not in proposal request"
-                    )
-                req_restrictions = proof_req_attr_spec.get("restrictions", {})
-
-                name = proof_req_attr_spec["name"]
-                proof_value = attr_spec["raw"]
-                sub_proof_index = attr_spec["sub_proof_index"]
-                schema_id = proof["identifiers"][sub_proof_index]["schema_id"]
-                cred_def_id = proof["identifiers"][sub_proof_index]["cred_def_id"]
-                criteria = {
-                    "schema_id": schema_id,
-                    "schema_issuer_did": schema_id.split(":")[-4],
-                    "schema_name": schema_id.split(":")[-2],
-                    "schema_version": schema_id.split(":")[-1],
-                    "cred_def_id": cred_def_id,
-                    "issuer_did": cred_def_id.split(":")[-5],
-                    f"attr::{name}::value": proof_value,
-                }
-
-                if (
-                    not any(r.items() <= criteria.items() for r in req_restrictions)
-                    and len(req_restrictions) != 0
-                ):
-                    raise V30PresFormatHandlerError(
-                        f"Presented attribute {reft} does not satisfy proof request "
-                        f"restrictions {req_restrictions}"
-                    )
-
-            # revealed attr groups
-            for reft, attr_spec in (
-                proof["requested_proof"].get("revealed_attr_groups", {}).items()
-            ):
-                proof_req_attr_spec = proof_req["requested_attributes"].get(reft)
-                if not proof_req_attr_spec:
-                    raise V30PresFormatHandlerError(
-                        f"Presentation referent {reft} not in proposal request"
-                    )
-                req_restrictions = proof_req_attr_spec.get("restrictions", {})
-                proof_values = {
-                    name: values["raw"] for name, values in attr_spec["values"].items()
-                }
-                sub_proof_index = attr_spec["sub_proof_index"]
-                schema_id = proof["identifiers"][sub_proof_index]["schema_id"]
-                cred_def_id = proof["identifiers"][sub_proof_index]["cred_def_id"]
-                criteria = {
-                    "schema_id": schema_id,
-                    "schema_issuer_did": schema_id.split(":")[-4],
-                    "schema_name": schema_id.split(":")[-2],
-                    "schema_version": schema_id.split(":")[-1],
-                    "cred_def_id": cred_def_id,
-                    "issuer_did": cred_def_id.split(":")[-5],
-                    **{
-                        f"attr::{name}::value": value
-                        for name, value in proof_values.items()
-                    },
-                }
-
-                if (
-                    not any(r.items() <= criteria.items() for r in req_restrictions)
-                    and len(req_restrictions) != 0
-                ):
-                    raise V30PresFormatHandlerError(
-                        f"Presented attr group {reft} does not satisfy proof request "
-                        f"restrictions {req_restrictions}"
-                    )
-
-            # predicate bounds
-            for reft, pred_spec in proof["requested_proof"]["predicates"].items():
-                proof_req_pred_spec = proof_req["requested_predicates"].get(reft)
-                if not proof_req_pred_spec:
-                    raise V30PresFormatHandlerError(
-                        f"Presentation referent {reft} not in proposal request"
-                    )
-                req_name = proof_req_pred_spec["name"]
-                req_pred = Predicate.get(proof_req_pred_spec["p_type"])
-                req_value = proof_req_pred_spec["p_value"]
-                req_restrictions = proof_req_pred_spec.get("restrictions", {})
-                for req_restriction in req_restrictions:
-                    for k in [k for k in req_restriction]:  # cannot modify en passant
-                        if k.startswith("attr::"):
-                            req_restriction.pop(k)  # let indy-sdk reject mismatch here
-                sub_proof_index = pred_spec["sub_proof_index"]
-                for ge_proof in proof["proof"]["proofs"][sub_proof_index][
-                    "primary_proof"
-                ]["ge_proofs"]:
-                    proof_pred_spec = ge_proof["predicate"]
-                    if proof_pred_spec["attr_name"] != canon(req_name):
-                        continue
-                    if not (
-                        Predicate.get(proof_pred_spec["p_type"]) is req_pred
-                        and proof_pred_spec["value"] == req_value
-                    ):
-                        raise V30PresFormatHandlerError(
-                            f"Presentation predicate on {req_name} "
-                            "mismatches proposal request"
-                        )
-                    break
-                else:
-                    raise V30PresFormatHandlerError(
-                        f"Proposed request predicate on {req_name} not in presentation"
-                    )
-
-                schema_id = proof["identifiers"][sub_proof_index]["schema_id"]
-                cred_def_id = proof["identifiers"][sub_proof_index]["cred_def_id"]
-                criteria = {
-                    "schema_id": schema_id,
-                    "schema_issuer_did": schema_id.split(":")[-4],
-                    "schema_name": schema_id.split(":")[-2],
-                    "schema_version": schema_id.split(":")[-1],
-                    "cred_def_id": cred_def_id,
-                    "issuer_did": cred_def_id.split(":")[-5],
-                }
-
-                if (
-                    not any(r.items() <= criteria.items() for r in req_restrictions)
-                    and len(req_restrictions) != 0
-                ):
-                    raise V30PresFormatHandlerError(
-                        f"Presented predicate {reft} does not satisfy proof request "
-                        f"restrictions {req_restrictions}"
-                    )
-
-        proof = message.attachments
-        for att in proof:
-            if (
-                V30PresFormat.Format.get(att.format.format).api
-                == V30PresFormat.Format.INDY.api
-            ):
-                proof = att.content
-        _check_proof_vs_proposal()
+        _check_proof_vs_proposal(
+            message.attachment(V30PresFormat.Format.INDY),
+            pres_ex_record.indy_attachment("pres_request"),
+        )
 
     async def verify_pres(self, pres_ex_record: V30PresExRecord) -> V30PresExRecord:
         """
@@ -337,38 +329,23 @@ class IndyPresExchangeHandler(V30PresFormatHandler):
             presentation exchange record, updated
 
         """
-        pres_request_msg = pres_ex_record.pres_request
-        indy_proof_request = pres_request_msg.attachments
-        for att in indy_proof_request:
-            if (
-                V30PresFormat.Format.get(att.format.format).api
-                == V30PresFormat.Format.INDY.api
-            ):
-                indy_proof_request = att.content
-        indy_proof = pres_ex_record.pres.attachments
-        for att in indy_proof:
-            if (
-                V30PresFormat.Format.get(att.format.format).api
-                == V30PresFormat.Format.INDY.api
-            ):
-                indy_proof = att.content
-        indy_handler = IndyPresExchHandler(self._profile)
+        indy_proof_request = pres_ex_record.indy_attachment("pres_request")
+        indy_proof = pres_ex_record.indy_attachment("pres")
         (
             schemas,
             cred_defs,
             rev_reg_defs,
             rev_reg_entries,
-        ) = await indy_handler.process_pres_identifiers(indy_proof["identifiers"])
+        ) = await self.indy_handler.process_pres_identifiers(indy_proof["identifiers"])
 
         verifier = self._profile.inject(IndyVerifier)
-        pres_ex_record.verified = json.dumps(  # tag: needs string value
-            await verifier.verify_presentation(
-                indy_proof_request,
-                indy_proof,
-                schemas,
-                cred_defs,
-                rev_reg_defs,
-                rev_reg_entries,
-            )
+        (verified, _) = await verifier.verify_presentation(
+            indy_proof_request,
+            indy_proof,
+            schemas,
+            cred_defs,
+            rev_reg_defs,
+            rev_reg_entries,
         )
+        pres_ex_record.verified = "true" if verified else "false"  # tag: needs str
         return pres_ex_record
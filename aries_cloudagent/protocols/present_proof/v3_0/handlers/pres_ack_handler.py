@@ -1,5 +1,7 @@
 """Presentation ack message handler."""
 
+import logging
+
 from .....core.oob_processor import OobMessageProcessor
 from .....messaging.base_handler import BaseHandler, HandlerException
 from .....messaging.request_context import RequestContext
@@ -25,10 +27,11 @@ class V30PresAckHandler(BaseHandler):
 
         self._logger.debug("V30PresAckHandler called with context %s", context)
         assert isinstance(context.message, V30PresAck)
-        self._logger.info(
-            "Received v3.0 presentation ack message: %s",
-            context.message.serialize(as_string=True),
-        )
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(
+                "Received v3.0 presentation ack message: %s",
+                context.message.serialize(as_string=True),
+            )
 
         # If connection is present it must be ready for use
         if context.connection_record and not context.connection_ready:
@@ -1,5 +1,7 @@
 """Presentation message handler."""
 
+import logging
+
 from .....core.oob_processor import OobMessageProcessor
 from .....ledger.error import LedgerError
 from .....messaging.base_handler import BaseHandler, HandlerException
@@ -31,10 +33,11 @@ class V30PresHandler(BaseHandler):
 
         self._logger.debug("V30PresHandler called with context %s", context)
         assert isinstance(context.message, V30Pres)
-        self._logger.info(
-            "Received presentation message: %s",
-            context.message.serialize(as_string=True),
-        )
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(
+                "Received presentation message: %s",
+                context.message.serialize(as_string=True),
+            )
 
         # If connection is present it must be ready for use
         if context.connection_record and not context.connection_ready:
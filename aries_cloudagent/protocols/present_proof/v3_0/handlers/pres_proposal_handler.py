@@ -1,5 +1,7 @@
 """Presentation proposal message handler."""
 
+import logging
+
 from .....ledger.error import LedgerError
 from .....messaging.base_handler import BaseHandler, HandlerException
 from .....messaging.models.base import BaseModelError
@@ -30,10 +32,11 @@ class V30PresProposalHandler(BaseHandler):
 
         self._logger.debug("V30PresProposalHandler called with context %s", context)
         assert isinstance(context.message, V30PresProposal)
-        self._logger.info(
-            "Received v2.0 presentation proposal message: %s",
-            context.message.serialize(as_string=True),
-        )
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(
+                "Received v2.0 presentation proposal message: %s",
+                context.message.serialize(as_string=True),
+            )
 
         if not context.connection_record:
             raise HandlerException(
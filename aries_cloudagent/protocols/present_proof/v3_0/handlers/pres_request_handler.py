@@ -1,5 +1,7 @@
 """Presentation request message handler."""
 
+import logging
+
 from .....core.oob_processor import OobMessageProcessor
 from .....indy.holder import IndyHolderError
 from .....ledger.error import LedgerError
@@ -35,10 +37,11 @@ class V30PresRequestHandler(BaseHandler):
 
         self._logger.debug("V30PresRequestHandler called with context %s", context)
         assert isinstance(context.message, V30PresRequest)
-        self._logger.info(
-            "Received v2.0 presentation request message: %s",
-            context.message.serialize(as_string=True),
-        )
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(
+                "Received v2.0 presentation request message: %s",
+                context.message.serialize(as_string=True),
+            )
 
         # If connection is present it must be ready for use
         if context.connection_record and not context.connection_ready:
@@ -64,36 +67,40 @@ class V30PresRequestHandler(BaseHandler):
         profile = context.profile
         pres_manager = V30PresManager(profile)
 
-        # Get pres ex record (holder initiated via proposal)
-        # or create it (verifier sent request first)
-        try:
-            async with profile.session() as session:
-                pres_ex_record = await V30PresExRecord.retrieve_by_tag_filter(
-                    session,
-                    {"thread_id": context.message._thread_id},
-                    {
-                        "connection_id": context.connection_record.connection_id,
-                        "role": V30PresExRecord.ROLE_PROVER,
-                    },
-                )  # holder initiated via proposal
-            pres_ex_record.pres_request = context.message
-        except StorageNotFoundError:
-            # verifier sent this request free of any proposal
-            pres_ex_record = V30PresExRecord(
-                connection_id=connection_id,
-                thread_id=context.message._thread_id,
-                initiator=V30PresExRecord.INITIATOR_EXTERNAL,
-                role=V30PresExRecord.ROLE_PROVER,
-                pres_request=context.message,
-                auto_present=context.settings.get(
-                    "debug.auto_respond_presentation_request"
-                ),
-                trace=(context.message._trace is not None),
-            )
+        async with profile.session() as session:
+            # Get pres ex record (holder initiated via proposal)
+            # or create it (verifier sent request first)
+            pres_ex_record = None
+            if context.message._thread and context.message._thread.thid:  # reply?
+                try:
+                    pres_ex_record = await V30PresExRecord.retrieve_by_tag_filter(
+                        session,
+                        {"thread_id": context.message._thread_id},
+                        {
+                            "connection_id": context.connection_record.connection_id,
+                            "role": V30PresExRecord.ROLE_PROVER,
+                        },
+                    )  # holder initiated via proposal
+                    pres_ex_record.pres_request = context.message
+                except StorageNotFoundError:
+                    pass
+            if not pres_ex_record:
+                # verifier sent this request free of any proposal
+                pres_ex_record = V30PresExRecord(
+                    connection_id=connection_id,
+                    thread_id=context.message._thread_id,
+                    initiator=V30PresExRecord.INITIATOR_EXTERNAL,
+                    role=V30PresExRecord.ROLE_PROVER,
+                    pres_request=context.message,
+                    auto_present=context.settings.get(
+                        "debug.auto_respond_presentation_request"
+                    ),
+                    trace=(context.message._trace is not None),
+                )
 
-        pres_ex_record = await pres_manager.receive_pres_request(
-            pres_ex_record
-        )  # mgr only saves record: on exception, saving state err is hopeless
+            pres_ex_record = await pres_manager.receive_pres_request(
+                pres_ex_record, session=session
+            )  # mgr only saves record: on exception, saving state err is hopeless
 
         r_time = trace_event(
             context.settings,
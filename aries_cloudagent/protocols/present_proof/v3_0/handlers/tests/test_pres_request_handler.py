@@ -187,6 +187,7 @@ class TestPresRequestHandler(AsyncTestCase):
         request_context.connection_record.connection_id = "dummy"
         request_context.message_receipt = MessageReceipt()
         request_context.message = V30PresRequest()
+        request_context.message.assign_thread_id("dummy-thid")
         request_context.message.attachment = async_mock.MagicMock(
             return_value=async_mock.MagicMock()
         )
@@ -234,7 +235,7 @@ class TestPresRequestHandler(AsyncTestCase):
             await handler.handle(request_context, responder)
 
         mock_pres_mgr.return_value.receive_pres_request.assert_called_once_with(
-            px_rec_instance
+            px_rec_instance, session=async_mock.ANY
         )
         mock_oob_processor.find_oob_record_for_inbound_message.assert_called_once_with(
             request_context
@@ -247,6 +248,7 @@ class TestPresRequestHandler(AsyncTestCase):
         request_context.connection_record.connection_id = "dummy"
         request_context.message_receipt = MessageReceipt()
         request_context.message = V30PresRequest()
+        request_context.message.assign_thread_id("dummy-thid")
         request_context.message.attachments = async_mock.MagicMock(
             return_value=async_mock.MagicMock()
         )
@@ -295,7 +297,67 @@ class TestPresRequestHandler(AsyncTestCase):
             await handler.handle(request_context, responder)
 
         mock_pres_mgr.return_value.receive_pres_request.assert_called_once_with(
-            px_rec_instance
+            px_rec_instance, session=async_mock.ANY
+        )
+        mock_oob_processor.find_oob_record_for_inbound_message.assert_called_once_with(
+            request_context
+        )
+        assert not responder.messages
+
+    async def test_called_no_thid(self):
+        request_context = RequestContext.test_context()
+        request_context.connection_record = async_mock.MagicMock()
+        request_context.connection_record.connection_id = "dummy"
+        request_context.message_receipt = MessageReceipt()
+        request_context.message = V30PresRequest()
+        request_context.message.attachments = async_mock.MagicMock(
+            return_value=async_mock.MagicMock()
+        )
+
+        mock_oob_processor = async_mock.MagicMock(
+            find_oob_record_for_inbound_message=async_mock.CoroutineMock(
+                return_value=async_mock.MagicMock()
+            )
+        )
+        request_context.injector.bind_instance(OobMessageProcessor, mock_oob_processor)
+
+        pres_proposal = V30PresProposal(
+            attachments=[
+                AttachDecorator.data_base64(
+                    INDY_PROOF_REQ,
+                    ident="indy",
+                    format=V30PresFormat(
+                        format_=V30PresFormat.Format.INDY.aries,
+                    ),
+                )
+            ],
+        )
+        px_rec_instance = test_module.V30PresExRecord(
+            pres_proposal=pres_proposal.serialize(),
+            auto_present=True,
+        )
+
+        with async_mock.patch.object(
+            test_module, "V30PresManager", autospec=True
+        ) as mock_pres_mgr, async_mock.patch.object(
+            test_module, "V30PresExRecord", autospec=True
+        ) as mock_px_rec_cls:
+
+            mock_px_rec_cls.retrieve_by_tag_filter = async_mock.CoroutineMock()
+            mock_px_rec_cls.return_value = px_rec_instance
+
+            mock_pres_mgr.return_value.receive_pres_request = async_mock.CoroutineMock(
+                return_value=async_mock.MagicMock(auto_present=False)
+            )
+
+            request_context.connection_ready = True
+            handler = test_module.V30PresRequestHandler()
+            responder = MockResponder()
+            await handler.handle(request_context, responder)
+
+        mock_px_rec_cls.retrieve_by_tag_filter.assert_not_called()
+        mock_pres_mgr.return_value.receive_pres_request.assert_called_once_with(
+            px_rec_instance, session=async_mock.ANY
         )
         mock_oob_processor.find_oob_record_for_inbound_message.assert_called_once_with(
             request_context
@@ -440,7 +502,7 @@ class TestPresRequestHandler(AsyncTestCase):
             mock_pres_mgr.return_value.create_pres.assert_called_once()
 
         mock_pres_mgr.return_value.receive_pres_request.assert_called_once_with(
-            mock_px_rec
+            mock_px_rec, session=async_mock.ANY
         )
         mock_oob_processor.find_oob_record_for_inbound_message.assert_called_once_with(
             request_context
@@ -530,7 +592,7 @@ class TestPresRequestHandler(AsyncTestCase):
             mock_pres_mgr.return_value.create_pres.assert_called_once()
 
         mock_pres_mgr.return_value.receive_pres_request.assert_called_once_with(
-            px_rec_instance
+            px_rec_instance, session=async_mock.ANY
         )
         mock_oob_processor.find_oob_record_for_inbound_message.assert_called_once_with(
             request_context
@@ -604,7 +666,7 @@ class TestPresRequestHandler(AsyncTestCase):
             mock_pres_mgr.return_value.create_pres.assert_called_once()
 
         mock_pres_mgr.return_value.receive_pres_request.assert_called_once_with(
-            px_rec_instance
+            px_rec_instance, session=async_mock.ANY
         )
         mock_oob_processor.find_oob_record_for_inbound_message.assert_called_once_with(
             request_context
@@ -680,7 +742,7 @@ class TestPresRequestHandler(AsyncTestCase):
             mock_px_rec.save_error_state.assert_called_once()
 
         mock_pres_mgr.return_value.receive_pres_request.assert_called_once_with(
-            mock_px_rec
+            mock_px_rec, session=async_mock.ANY
         )
         mock_oob_processor.find_oob_record_for_inbound_message.assert_called_once_with(
             request_context
@@ -747,7 +809,7 @@ class TestPresRequestHandler(AsyncTestCase):
             mock_pres_mgr.return_value.create_pres.assert_called_once()
 
         mock_pres_mgr.return_value.receive_pres_request.assert_called_once_with(
-            px_rec_instance
+            px_rec_instance, session=async_mock.ANY
         )
         mock_oob_processor.find_oob_record_for_inbound_message.assert_called_once_with(
             request_context
@@ -820,7 +882,7 @@ class TestPresRequestHandler(AsyncTestCase):
             mock_pres_mgr.return_value.create_pres.assert_called_once()
 
         mock_pres_mgr.return_value.receive_pres_request.assert_called_once_with(
-            px_rec_instance
+            px_rec_instance, session=async_mock.ANY
         )
         mock_oob_processor.find_oob_record_for_inbound_message.assert_called_once_with(
             request_context
@@ -940,7 +1002,7 @@ class TestPresRequestHandler(AsyncTestCase):
             mock_pres_mgr.return_value.create_pres.assert_called_once()
 
         mock_pres_mgr.return_value.receive_pres_request.assert_called_once_with(
-            px_rec_instance
+            px_rec_instance, session=async_mock.ANY
         )
         mock_oob_processor.find_oob_record_for_inbound_message.assert_called_once_with(
             request_context
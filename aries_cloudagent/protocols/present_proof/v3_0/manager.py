@@ -1,15 +1,18 @@
 """Classes to manage presentations."""
 
+import asyncio
 import logging
 
-from typing import Optional, Tuple
+from typing import Optional, Sequence, Tuple
 
 from ...out_of_band.v1_0.models.oob_record import OobRecord
 from ....connections.models.conn_record import ConnRecord
 from ....core.error import BaseError
-from ....core.profile import Profile
+from ....core.profile import Profile, ProfileSession
+from ....messaging.decorators.attach_decorator_didcomm_v2_pres import AttachDecorator
 from ....messaging.responder import BaseResponder
 
+from .formats.handler import V30PresFormatHandler
 from .messages.pres import V30Pres
 from .messages.pres_ack import V30PresAck
 from .messages.pres_format import V30PresFormat
@@ -27,9 +30,22 @@ class V30PresManagerError(BaseError):
     """Presentation error."""
 
 
+def _attachment_formats(
+    attachments: Sequence[AttachDecorator],
+) -> Sequence[V30PresFormat.Format]:
+    """Return supported formats of input attachments, each once, in order."""
+    formats = dict.fromkeys(
+        V30PresFormat.Format.get(attach.format.format) for attach in attachments
+    )
+    formats.pop(None, None)
+    return list(formats)
+
+
 class V30PresManager:
     """Class for managing presentations."""
 
+    __slots__ = ("_profile", "_handlers", "_responder")
+
     def __init__(self, profile: Profile):
         """
         Initialize a V30PresManager.
@@ -39,6 +55,16 @@ class V30PresManager:
         """
 
         self._profile = profile
+        self._handlers = {}
+        self._responder = None
+
+    def _handler(self, pres_format: V30PresFormat.Format) -> V30PresFormatHandler:
+        """Return format handler for this manager's profile, created on first use."""
+        handler = self._handlers.get(pres_format)
+        if handler is None:
+            handler = pres_format.handler(self._profile)
+            self._handlers[pres_format] = handler
+        return handler
 
     async def create_exchange_for_proposal(
         self,
@@ -123,23 +149,16 @@ class V30PresManager:
             A tuple (updated presentation exchange record, presentation request message)
 
         """
-        proof_proposal = pres_ex_record.pres_proposal
-        input_attachments = proof_proposal.attachments
-        input_formats = []
-        for attach in input_attachments:
-            input_formats.append(attach.format)
-
-        request_formats = []
-        for format in input_formats:
-            pres_exch_format = V30PresFormat.Format.get(format.format)
-
-            if pres_exch_format:
-                request_formats.append(
-                    await pres_exch_format.handler(self._profile).create_bound_request(
-                        pres_ex_record,
-                        request_data,
-                    )
+        input_formats = _attachment_formats(pres_ex_record.pres_proposal.attachments)
+        request_formats = await asyncio.gather(
+            *(
+                self._handler(pres_exch_format).create_bound_request(
+                    pres_ex_record,
+                    request_data,
                 )
+                for pres_exch_format in input_formats
+            )
+        )
         if len(request_formats) == 0:
             raise V30PresManagerError(
                 "Unable to create presentation request. No supported formats"
@@ -200,29 +219,34 @@ class V30PresManager:
 
         return pres_ex_record
 
-    async def receive_pres_request(self, pres_ex_record: V30PresExRecord):
+    async def receive_pres_request(
+        self, pres_ex_record: V30PresExRecord, session: ProfileSession = None
+    ):
         """
         Receive a presentation request.
 
         Args:
             pres_ex_record: presentation exchange record with request to receive
+            session: Optional open profile session in which to save the record
 
         Returns:
             The presentation exchange record, updated
 
         """
         pres_ex_record.state = V30PresExRecord.STATE_REQUEST_RECEIVED
-        async with self._profile.session() as session:
-            await pres_ex_record.save(
-                session, reason="receive v3.0 presentation request"
-            )
+        reason = "receive v3.0 presentation request"
+        if session:
+            await pres_ex_record.save(session, reason=reason)
+        else:
+            async with self._profile.session() as session:
+                await pres_ex_record.save(session, reason=reason)
 
         return pres_ex_record
 
     async def create_pres(
         self,
         pres_ex_record: V30PresExRecord,
-        request_data: dict = {},
+        request_data: dict = None,
         *,
         comment: str = None,
     ) -> Tuple[V30PresExRecord, V30Pres]:
@@ -261,35 +285,22 @@ class V30PresManager:
             A tuple (updated presentation exchange record, presentation message)
 
         """
-        proof_request = pres_ex_record.pres_request
-        input_attachments = proof_request.attachments
-        input_formats = []
-        for attach in input_attachments:
-            input_formats.append(attach.format)
-
-        pres_formats = []
-        for format in input_formats:
-            # TODO: split the format
-
-            pres_exch_format = V30PresFormat.Format.get(format.format)
-
-            if pres_exch_format:
-                if not request_data:
-                    request_data_pres_exch = {}
-                else:
-                    request_data_pres_exch = {
-                        pres_exch_format.api: request_data.get(pres_exch_format.api)
-                    }
-                pres_tuple = await pres_exch_format.handler(self._profile).create_pres(
+        input_formats = _attachment_formats(pres_ex_record.pres_request.attachments)
+        pres_formats = await asyncio.gather(
+            *(
+                self._handler(pres_exch_format).create_pres(
                     pres_ex_record,
-                    request_data_pres_exch,
+                    {pres_exch_format.api: request_data.get(pres_exch_format.api)}
+                    if request_data
+                    else {},
                 )
-                if pres_tuple:
-                    pres_formats.append(pres_tuple)
-                else:
-                    raise V30PresManagerError(
-                        "Unable to create presentation. ProblemReport message sent"
-                    )
+                for pres_exch_format in input_formats
+            )
+        )
+        if not all(pres_formats):
+            raise V30PresManagerError(
+                "Unable to create presentation. ProblemReport message sent"
+            )
         if len(pres_formats) == 0:
             raise V30PresManagerError(
                 "Unable to create presentation. No supported formats"
@@ -307,11 +318,7 @@ class V30PresManager:
 
         # save presentation exchange state
         pres_ex_record.state = V30PresExRecord.STATE_PRESENTATION_SENT
-        pres_ex_record.pres = V30Pres(
-            body=V30PresBody(),
-            # formats=[format for (format, _) in pres_formats],
-            attachments=[attach for (_, attach) in pres_formats],
-        )
+        pres_ex_record.pres = pres_message
         async with self._profile.session() as session:
             await pres_ex_record.save(session, reason="create v3.0 presentation")
         return pres_ex_record, pres_message
@@ -353,34 +360,29 @@ class V30PresManager:
                 },
             )
 
+        prior_value = pres_ex_record.record_value
+
         # Save connection id (if it wasn't already present)
         if connection_record:
             pres_ex_record.connection_id = connection_record.connection_id
-        input_formats = []
-        input_attachments = message.attachments
-
-        for attach in input_attachments:
-            input_formats.append(attach.format)
-
-        for format in input_formats:
-            pres_format = V30PresFormat.Format.get(format.format)
-
-            if pres_format:
-                receive_pres_return = await pres_format.handler(
-                    self._profile
-                ).receive_pres(
+        receive_pres_returns = await asyncio.gather(
+            *(
+                self._handler(pres_format).receive_pres(
                     message,
                     pres_ex_record,
                 )
-                if isinstance(receive_pres_return, bool) and not receive_pres_return:
-                    raise V30PresManagerError(
-                        "Unable to verify received presentation."
-                        " ProblemReport message sent"
-                    )
+                for pres_format in _attachment_formats(message.attachments)
+            )
+        )
+        if any(ret is False for ret in receive_pres_returns):
+            raise V30PresManagerError(
+                "Unable to verify received presentation. ProblemReport message sent"
+            )
         pres_ex_record.pres = message
         pres_ex_record.state = V30PresExRecord.STATE_PRESENTATION_RECEIVED
-        async with self._profile.session() as session:
-            await pres_ex_record.save(session, reason="receive v3.0 presentation")
+        if pres_ex_record.record_value != prior_value:  # else redelivered: no-op
+            async with self._profile.session() as session:
+                await pres_ex_record.save(session, reason="receive v3.0 presentation")
 
         return pres_ex_record
 
@@ -397,22 +399,14 @@ class V30PresManager:
 
         """
         pres_request_msg = pres_ex_record.pres_request
-        input_attachments = pres_request_msg.attachments
-        input_formats = []
-        for attach in input_attachments:
-            input_formats.append(attach.format)
-
-        for format in input_formats:
-            pres_exch_format = V30PresFormat.Format.get(format.format)
-
-            if pres_exch_format:
-                pres_ex_record = await pres_exch_format.handler(
-                    self._profile
-                ).verify_pres(
-                    pres_ex_record,
-                )
-                if pres_ex_record.verified == "false":
-                    break
+
+        # handlers set verified on the record in turn: stop at the first failure
+        for pres_exch_format in _attachment_formats(pres_request_msg.attachments):
+            pres_ex_record = await self._handler(pres_exch_format).verify_pres(
+                pres_ex_record,
+            )
+            if pres_ex_record.verified == "false":
+                break
 
         pres_ex_record.state = V30PresExRecord.STATE_DONE
 
@@ -432,7 +426,9 @@ class V30PresManager:
             pres_ex_record: presentation exchange record with thread id
 
         """
-        responder = self._profile.inject_or(BaseResponder)
+        if self._responder is None:
+            self._responder = self._profile.inject_or(BaseResponder)
+        responder = self._responder
 
         if responder:
             pres_ack_message = V30PresAck(verification_result=pres_ex_record.verified)
@@ -461,20 +457,22 @@ class V30PresManager:
 
         """
         connection_id = conn_record.connection_id if conn_record else None
-        async with self._profile.session() as session:
+        async with self._profile.transaction() as txn:
             pres_ex_record = await V30PresExRecord.retrieve_by_tag_filter(
-                session,
+                txn,
                 {"thread_id": message._thread_id},
                 {
                     # connection_id can be null in connectionless
                     "connection_id": connection_id,
                     "role": V30PresExRecord.ROLE_PROVER,
                 },
+                for_update=True,
             )
-            pres_ex_record.verified = message._verification_result
+            pres_ex_record.verified = message.verification_result
             pres_ex_record.state = V30PresExRecord.STATE_DONE
 
-            await pres_ex_record.save(session, reason="receive v3.0 presentation ack")
+            await pres_ex_record.save(txn, reason="receive v3.0 presentation ack")
+            await txn.commit()
 
         return pres_ex_record
 
@@ -488,19 +486,20 @@ class V30PresManager:
             presentation exchange record, retrieved and updated
 
         """
-        # FIXME use transaction, fetch for_update
-        async with self._profile.session() as session:
+        async with self._profile.transaction() as txn:
             pres_ex_record = await (
                 V30PresExRecord.retrieve_by_tag_filter(
-                    session,
+                    txn,
                     {"thread_id": message._thread_id},
                     {"connection_id": connection_id},
+                    for_update=True,
                 )
             )
 
             pres_ex_record.state = V30PresExRecord.STATE_ABANDONED
             code = message.description.get("code", ProblemReportReason.ABANDONED.value)
             pres_ex_record.error_msg = f"{code}: {message.description.get('en', code)}"
-            await pres_ex_record.save(session, reason="received problem report")
+            await pres_ex_record.save(txn, reason="received problem report")
+            await txn.commit()
 
         return pres_ex_record
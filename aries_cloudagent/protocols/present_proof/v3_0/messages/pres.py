@@ -1,6 +1,6 @@
 """A (proof) presentation content message."""
 
-from marshmallow import EXCLUDE, fields, validates_schema, ValidationError
+from marshmallow import EXCLUDE, fields, validates_schema
 from typing import Sequence
 
 from .....messaging.agent_message import (
@@ -53,17 +53,16 @@ class V30Pres(AgentMessage):
         self.attachments = list(attachments) if attachments else []
 
     def attachment(self, fmt: V30PresFormat.Format = None) -> dict:
-        """Return attachment if exists else returns none."""
-
-        if len(self.attachments) != 0:
-            for att in self.attachments:
-                try:
-                    if V30PresFormat.Format.get(att.format.format).api == fmt.api:
-                        return att.content
-                except AttributeError:
-                    return None
-        else:
+        """Return content of first attachment in input format, or None if none."""
+        if fmt is None or not self.attachments:
             return None
+        for att in self.attachments:
+            att_fmt = getattr(att, "format", None)
+            if att_fmt is None:
+                continue
+            if V30PresFormat.Format.get(att_fmt.format) is fmt:
+                return att.content
+        return None
 
 
 class V30PresSchema(AgentMessageSchemaV2):
@@ -99,13 +98,6 @@ class V30PresSchema(AgentMessageSchemaV2):
     def validate_fields(self, data, **kwargs):
         """Validate presentation attachment per format."""
         attachments = data.get("attachments") or []
-        formats = []
-        for atch in attachments:
-            formats.append(atch.format)
-
-        if len(formats) != len(attachments):
-            raise ValidationError("Formats/attachments length mismatch")
-
         for atch in attachments:
             pres_format = V30PresFormat.Format.get(atch.format.format)
             if pres_format:
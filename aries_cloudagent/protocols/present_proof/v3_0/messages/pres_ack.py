@@ -1,6 +1,8 @@
 """Represents an explicit RFC 15 ack message, adopted into present-proof protocol."""
 
-from marshmallow import EXCLUDE, fields, validate
+from marshmallow import EXCLUDE, fields
+
+from .....messaging.valid import OneOfSet
 
 from ....notification.v1_0.messages.ack import V10Ack, V10AckSchema
 
@@ -28,7 +30,7 @@ class V30PresAck(V10Ack):
 
         """
         super().__init__(status, **kwargs)
-        self._verification_result = verification_result
+        self.verification_result = verification_result
 
 
 class V30PresAckSchema(V10AckSchema):
@@ -40,10 +42,9 @@ class V30PresAckSchema(V10AckSchema):
         model_class = V30PresAck
         unknown = EXCLUDE
 
-
-verification_result = fields.Str(
-    required=False,
-    description="Whether presentation is verified: true or false",
-    example="true",
-    validate=validate.OneOf(["true", "false"]),
-)
+    verification_result = fields.Str(
+        required=False,
+        description="Whether presentation is verified: true or false",
+        example="true",
+        validate=OneOfSet(["true", "false"]),
+    )
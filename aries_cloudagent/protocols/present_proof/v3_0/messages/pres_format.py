@@ -2,6 +2,7 @@
 
 from collections import namedtuple
 from enum import Enum
+from functools import lru_cache
 from marshmallow import EXCLUDE, fields
 from typing import Mapping, Type, Union, TYPE_CHECKING
 
@@ -42,8 +43,9 @@ class V30PresFormat(BaseModel):
         )
 
         @classmethod
+        @lru_cache(maxsize=32)
         def get(cls, label: Union[str, "V30PresFormat.Format"]):
-            """Get format enum for label."""
+            """Get format enum for label, memoized: formats are fixed."""
             if isinstance(label, str):
                 for fmt in V30PresFormat.Format:
                     if label.startswith(fmt.aries) or label == fmt.api:
@@ -1,7 +1,7 @@
 """A presentation proposal content message."""
 
 from typing import Sequence
-from marshmallow import EXCLUDE, fields, validates_schema, ValidationError
+from marshmallow import EXCLUDE, fields, validates_schema
 
 
 from .....messaging.agent_message import AgentMessage, AgentMessageSchemaV2
@@ -36,7 +36,7 @@ class V30PresProposal(AgentMessage):
         _id: str = None,
         *,
         # comment: str = None,
-        body: V30PresBody = V30PresBody(),
+        body: V30PresBody = None,
         attachments: Sequence[AttachDecorator] = None,
         **kwargs,
     ):
@@ -51,21 +51,21 @@ class V30PresProposal(AgentMessage):
         """
         super().__init__(_id, **kwargs)
         # self.comment = comment, now in:
-        self.body = body
+        self.body = body if body is not None else V30PresBody()
         # self.formats = list(formats) if formats else []
         self.attachments = list(attachments) if attachments else []
 
     def attachment(self, fmt: V30PresFormat.Format = None) -> dict:
-        """Return attachment or None if no attachments exists."""
-        if len(self.attachments) != 0:
-            for att in self.attachments:
-                try:
-                    if V30PresFormat.Format.get(att.format.format).api == fmt.api:
-                        return att.content
-                except AttributeError:
-                    return None
-        else:
+        """Return content of first attachment in input format, or None if none."""
+        if fmt is None or not self.attachments:
             return None
+        for att in self.attachments:
+            att_fmt = getattr(att, "format", None)
+            if att_fmt is None:
+                continue
+            if V30PresFormat.Format.get(att_fmt.format) is fmt:
+                return att.content
+        return None
 
 
 class V30PresProposalSchema(AgentMessageSchemaV2):
@@ -101,13 +101,6 @@ class V30PresProposalSchema(AgentMessageSchemaV2):
     def validate_fields(self, data, **kwargs):
         """Validate presentation attachment per format."""
         attachments = data.get("attachments") or []
-
-        formats = []
-        for atch in attachments:
-            formats.append(atch.format)
-        if len(formats) != len(attachments):
-            raise ValidationError("Formats/attachments length mismatch")
-
         for atch in attachments:
             # atch = get_attach_by_id(fmt.attach_id)
             pres_format = V30PresFormat.Format.get(atch.format.format)
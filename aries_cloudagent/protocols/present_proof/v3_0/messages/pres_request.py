@@ -1,7 +1,7 @@
 """A presentation request content message."""
 
 from typing import Sequence
-from marshmallow import EXCLUDE, fields, validates_schema, ValidationError
+from marshmallow import EXCLUDE, fields, validates_schema
 
 
 from .....messaging.agent_message import AgentMessage, AgentMessageSchemaV2
@@ -34,7 +34,7 @@ class V30PresRequest(AgentMessage):
         self,
         _id: str = None,
         *,
-        body: V30PresBody = V30PresBody(),  # is REQUIRED in didcomv2
+        body: V30PresBody = None,  # is REQUIRED in didcomv2
         attachments: Sequence[AttachDecorator] = None,
         **kwargs,
     ):
@@ -48,21 +48,21 @@ class V30PresRequest(AgentMessage):
         """
         super().__init__(_id=_id, **kwargs)
 
-        self.body = body
+        self.body = body if body is not None else V30PresBody()
 
         self.attachments = list(attachments) if attachments else []
 
     def attachment(self, fmt: V30PresFormat.Format = None) -> dict:
-        """Return attachment or None if no attachments exists."""
-        if len(self.attachments) != 0:
-            for att in self.attachments:
-                try:
-                    if V30PresFormat.Format.get(att.format.format).api == fmt.api:
-                        return att.content
-                except AttributeError:
-                    return None
-        else:
+        """Return content of first attachment in input format, or None if none."""
+        if fmt is None or not self.attachments:
             return None
+        for att in self.attachments:
+            att_fmt = getattr(att, "format", None)
+            if att_fmt is None:
+                continue
+            if V30PresFormat.Format.get(att_fmt.format) is fmt:
+                return att.content
+        return None
 
 
 class V30PresRequestSchema(AgentMessageSchemaV2):
@@ -96,13 +96,6 @@ class V30PresRequestSchema(AgentMessageSchemaV2):
     def validate_fields(self, data, **kwargs):
         """Validate presentation attachment per format."""
         attachments = data.get("attachments") or []
-        formats = []
-        for atch in attachments:
-            formats.append(atch.format)
-
-        if len(formats) != len(attachments):
-            raise ValidationError("Formats/attachments length mismatch")
-
         for atch in attachments:
             pres_format = V30PresFormat.Format.get(atch.format.format)
             if pres_format:
@@ -3,6 +3,8 @@ import json
 from datetime import datetime, timezone
 from unittest import TestCase
 
+from ......messaging.models.base import BaseModelError
+
 from .....didcomm_prefix import DIDCommPrefix
 
 from ...message_types import PRES_30_ACK
@@ -32,6 +34,34 @@ class TestV30PresAck(TestCase):
         pres_ack = V30PresAck.deserialize(dump)
         assert type(pres_ack) == V30PresAck
 
+    def test_deserialize_verification_result(self):
+        """Test deserialization validates verification result."""
+        pres_ack = V30PresAck.deserialize(
+            {
+                "@type": DIDCommPrefix.qualify_current(PRES_30_ACK),
+                "status": "OK",
+                "verification_result": "true",
+            }
+        )
+        assert pres_ack.verification_result == "true"
+
+        with self.assertRaises(BaseModelError):
+            V30PresAck.deserialize(
+                {
+                    "@type": DIDCommPrefix.qualify_current(PRES_30_ACK),
+                    "status": "OK",
+                    "verification_result": "maybe",
+                }
+            )
+
+    def test_serde_verification_result(self):
+        """Test verification result survives serialization round trip."""
+        pres_ack_dict = V30PresAck(verification_result="false").serialize()
+        assert pres_ack_dict["verification_result"] == "false"
+
+        pres_ack = V30PresAck.deserialize(pres_ack_dict)
+        assert pres_ack.verification_result == "false"
+
     def test_serialize(self):
         """Test serialization."""
         pres_ack_dict = V30PresAck().serialize()
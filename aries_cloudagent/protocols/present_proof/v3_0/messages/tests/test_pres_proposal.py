@@ -156,3 +156,59 @@ class TestV30PresProposal(TestCase):
             ],
         )
         assert x_pres_proposal.attachment() is None
+
+    def test_attachment_skips_unformatted(self):
+        """Test attachment lookup skips attachments without a format."""
+
+        x_pres_proposal = V30PresProposal(
+            body=V30PresBody(comment="Test"),
+            attachments=[
+                AttachDecorator.data_base64(
+                    ident="no_format",
+                    mapping=INDY_PROOF_REQ[1],
+                ),
+                AttachDecorator.data_base64(
+                    ident="indy",
+                    mapping=INDY_PROOF_REQ[0],
+                    format=V30PresFormat(
+                        format_=ATTACHMENT_FORMAT[PRES_30_PROPOSAL][
+                            V30PresFormat.Format.INDY.api
+                        ]
+                    ),
+                ),
+            ],
+        )
+        assert (
+            x_pres_proposal.attachment(V30PresFormat.Format.INDY) == INDY_PROOF_REQ[0]
+        )
+
+    def test_attachment_first_match(self):
+        """Test attachment lookup returns the first attachment in the format."""
+
+        indy_format = V30PresFormat(
+            format_=ATTACHMENT_FORMAT[PRES_30_PROPOSAL][V30PresFormat.Format.INDY.api]
+        )
+        x_pres_proposal = V30PresProposal(
+            body=V30PresBody(comment="Test"),
+            attachments=[
+                AttachDecorator.data_base64(
+                    ident="indy-0",
+                    mapping=INDY_PROOF_REQ[0],
+                    format=indy_format,
+                ),
+                AttachDecorator.data_base64(
+                    ident="indy-1",
+                    mapping=INDY_PROOF_REQ[1],
+                    format=indy_format,
+                ),
+            ],
+        )
+        assert (
+            x_pres_proposal.attachment(V30PresFormat.Format.INDY) == INDY_PROOF_REQ[0]
+        )
+
+    def test_default_body_not_shared(self):
+        """Test each proposal built without a body gets its own."""
+        body = V30PresProposal().body
+        assert isinstance(body, V30PresBody)
+        assert V30PresProposal().body is not body
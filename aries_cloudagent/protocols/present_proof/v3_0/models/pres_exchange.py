@@ -2,13 +2,15 @@
 
 import logging
 
-from typing import Any, Mapping, Union
+from operator import attrgetter
 
-from marshmallow import fields, Schema, validate
+from typing import Any, Mapping, Optional, Union
+
+from marshmallow import fields, Schema
 
 from .....core.profile import ProfileSession
 from .....messaging.models.base_record import BaseExchangeRecord, BaseExchangeSchema
-from .....messaging.valid import UUIDFour
+from .....messaging.valid import OneOfSet, UUIDFour
 from .....storage.base import StorageError
 
 from ..messages.pres import V30Pres, V30PresSchema
@@ -20,6 +22,19 @@ from . import UNENCRYPTED_TAGS
 
 LOGGER = logging.getLogger(__name__)
 
+_SCALAR_PROPS = (
+    "connection_id",
+    "initiator",
+    "role",
+    "state",
+    "verified",
+    "auto_present",
+    "auto_verify",
+    "error_msg",
+    "trace",
+)
+_get_scalar_props = attrgetter(*_SCALAR_PROPS)
+
 
 class V30PresExRecord(BaseExchangeRecord):
     """Represents a V3.0 presentation exchange."""
@@ -49,6 +64,19 @@ class V30PresExRecord(BaseExchangeRecord):
     STATE_DONE = "done"
     STATE_ABANDONED = "abandoned"
 
+    INITIATORS = (INITIATOR_SELF, INITIATOR_EXTERNAL)
+    ROLES = (ROLE_PROVER, ROLE_VERIFIER)
+    STATES = (
+        STATE_PROPOSAL_SENT,
+        STATE_PROPOSAL_RECEIVED,
+        STATE_REQUEST_SENT,
+        STATE_REQUEST_RECEIVED,
+        STATE_PRESENTATION_SENT,
+        STATE_PRESENTATION_RECEIVED,
+        STATE_DONE,
+        STATE_ABANDONED,
+    )
+
     def __init__(
         self,
         *,
@@ -83,6 +111,7 @@ class V30PresExRecord(BaseExchangeRecord):
         self.auto_present = auto_present
         self.auto_verify = auto_verify
         self.error_msg = error_msg
+        self._by_format = None
 
     @property
     def pres_ex_id(self) -> str:
@@ -91,33 +120,36 @@ class V30PresExRecord(BaseExchangeRecord):
 
     @property
     def by_format(self) -> Mapping:
-        """Record proposal, request, and presentation attachments by format."""
-        result = {}
-        for item, cls in {
-            "pres_proposal": V30PresProposal,  # note: proof request attached for indy
-            "pres_request": V30PresRequest,
-            "pres": V30Pres,
-        }.items():
-            msg = getattr(self, item)
-
-            if msg:
-                try:
-                    result.update(
-                        {
-                            item: {
-                                V30PresFormat.Format.get(
-                                    atch.format.format
-                                ).api: msg.attachment(
-                                    V30PresFormat.Format.get(atch.format.format)
-                                )
+        """
+        Record proposal, request, and presentation attachments by format.
+
+        The result is memoized until a message changes and is shared by all
+        callers: do not mutate it. Use indy_attachment() for content to modify.
+
+        """
+        if self._by_format is None:
+            result = {}
+            for item in (
+                "pres_proposal",  # note: proof request attached for indy
+                "pres_request",
+                "pres",
+            ):
+                msg = getattr(self, item)
+
+                if msg:
+                    try:
+                        result[item] = {
+                            pres_format.api: msg.attachment(pres_format)
+                            for pres_format in (
+                                V30PresFormat.Format.get(atch.format.format)
                                 for atch in msg.attachments
-                            }
+                            )
                         }
-                    )
-                except AttributeError:
-                    result.update({item: {""}})
+                    except AttributeError:
+                        result[item] = {""}
+            self._by_format = result
 
-        return result
+        return self._by_format
 
     @property
     def pres_proposal(self) -> V30PresProposal:
@@ -128,6 +160,7 @@ class V30PresExRecord(BaseExchangeRecord):
     def pres_proposal(self, value):
         """Setter; store de/serialized views."""
         self._pres_proposal = V30PresProposal.serde(value)
+        self._by_format = None
 
     @property
     def pres_request(self) -> V30PresRequest:
@@ -138,6 +171,7 @@ class V30PresExRecord(BaseExchangeRecord):
     def pres_request(self, value):
         """Setter; store de/serialized views."""
         self._pres_request = V30PresRequest.serde(value)
+        self._by_format = None
 
     @property
     def pres(self) -> V30Pres:
@@ -148,6 +182,12 @@ class V30PresExRecord(BaseExchangeRecord):
     def pres(self, value):
         """Setter; store de/serialized views."""
         self._pres = V30Pres.serde(value)
+        self._by_format = None
+
+    def indy_attachment(self, item: str) -> Optional[Mapping]:
+        """Return first indy attachment content of proposal, request, or pres."""
+        msg = getattr(self, item)
+        return msg.attachment(V30PresFormat.Format.INDY) if msg else None
 
     async def save_error_state(
         self,
@@ -188,37 +228,29 @@ class V30PresExRecord(BaseExchangeRecord):
     @property
     def record_value(self) -> Mapping:
         """Accessor for the JSON record value generated for this credential exchange."""
-        return {
-            **{
-                prop: getattr(self, prop)
-                for prop in (
-                    "connection_id",
-                    "initiator",
-                    "role",
-                    "state",
-                    "verified",
-                    "auto_present",
-                    "auto_verify",
-                    "error_msg",
-                    "trace",
-                )
-            },
-            **{
-                prop: getattr(self, f"_{prop}").ser
-                for prop in (
-                    "pres_proposal",
-                    "pres_request",
-                    "pres",
-                )
-                if getattr(self, prop) is not None
-            },
-        }
+        value = dict(zip(_SCALAR_PROPS, _get_scalar_props(self)))
+        for prop, serde in (
+            ("pres_proposal", self._pres_proposal),
+            ("pres_request", self._pres_request),
+            ("pres", self._pres),
+        ):
+            if serde is not None:
+                value[prop] = serde.ser
+        return value
 
     def __eq__(self, other: Any) -> bool:
         """Comparison between records."""
         return super().__eq__(other)
 
 
+class V30PresExRecordByFormatSchema(Schema):
+    """Schema for attachment content by format on a presentation exchange."""
+
+    pres_proposal = fields.Dict(required=False)
+    pres_request = fields.Dict(required=False)
+    pres = fields.Dict(required=False)
+
+
 class V30PresExRecordSchema(BaseExchangeSchema):
     """Schema for de/serialization of V3.0 presentation exchange records."""
 
@@ -246,36 +278,18 @@ class V30PresExRecordSchema(BaseExchangeSchema):
         required=False,
         description="Present-proof exchange initiator: self or external",
         example=V30PresExRecord.INITIATOR_SELF,
-        validate=validate.OneOf(
-            [
-                getattr(V30PresExRecord, m)
-                for m in vars(V30PresExRecord)
-                if m.startswith("INITIATOR_")
-            ]
-        ),
+        validate=OneOfSet(V30PresExRecord.INITIATORS),
     )
     role = fields.Str(
         required=False,
         description="Present-proof exchange role: prover or verifier",
         example=V30PresExRecord.ROLE_PROVER,
-        validate=validate.OneOf(
-            [
-                getattr(V30PresExRecord, m)
-                for m in vars(V30PresExRecord)
-                if m.startswith("ROLE_")
-            ]
-        ),
+        validate=OneOfSet(V30PresExRecord.ROLES),
     )
     state = fields.Str(
         required=False,
         description="Present-proof exchange state",
-        validate=validate.OneOf(
-            [
-                getattr(V30PresExRecord, m)
-                for m in vars(V30PresExRecord)
-                if m.startswith("STATE_")
-            ]
-        ),
+        validate=OneOfSet(V30PresExRecord.STATES),
     )
     pres_proposal = fields.Nested(
         V30PresProposalSchema(),
@@ -293,14 +307,7 @@ class V30PresExRecordSchema(BaseExchangeSchema):
         description="Presentation message",
     )
     by_format = fields.Nested(
-        Schema.from_dict(
-            {
-                "pres_proposal": fields.Dict(required=False),
-                "pres_request": fields.Dict(required=False),
-                "pres": fields.Dict(required=False),
-            },
-            name="V30PresExRecordByFormatSchema",
-        ),
+        V30PresExRecordByFormatSchema,
         required=False,
         description=(
             "Attachment content by format for proposal, request, and presentation"
@@ -311,7 +318,7 @@ class V30PresExRecordSchema(BaseExchangeSchema):
         required=False,
         description="Whether presentation is verified: 'true' or 'false'",
         example="true",
-        validate=validate.OneOf(["true", "false"]),
+        validate=OneOfSet(["true", "false"]),
     )
     auto_present = fields.Bool(
         required=False,
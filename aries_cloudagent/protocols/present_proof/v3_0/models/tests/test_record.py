@@ -121,6 +121,68 @@ class TestRecord(AsyncTestCase):
         bx_record = BasexRecordImpl()
         assert record != bx_record
 
+    async def test_indy_attachment(self):
+        pres_proposal = V30PresProposal(
+            body=V30PresBody(comment="Hello World"),
+            attachments=[
+                AttachDecorator.data_base64(
+                    INDY_PROOF_REQ,
+                    ident="indy",
+                    format=V30PresFormat(
+                        format_=ATTACHMENT_FORMAT[PRES_30_PROPOSAL][
+                            V30PresFormat.Format.INDY.api
+                        ],
+                    ),
+                )
+            ],
+        )
+        record = V30PresExRecord(pres_proposal=pres_proposal)
+        assert record.indy_attachment("pres_request") is None
+
+        content = record.indy_attachment("pres_proposal")
+        assert content == INDY_PROOF_REQ
+        content["name"] = "changed"  # content decodes fresh per call
+        assert record.indy_attachment("pres_proposal") == INDY_PROOF_REQ
+
+        record.pres_proposal = None
+        assert record.indy_attachment("pres_proposal") is None
+
+    async def test_by_format(self):
+        pres_proposal = V30PresProposal(
+            body=V30PresBody(comment="Hello World"),
+            attachments=[
+                AttachDecorator.data_base64(
+                    INDY_PROOF_REQ,
+                    ident="indy",
+                    format=V30PresFormat(
+                        format_=ATTACHMENT_FORMAT[PRES_30_PROPOSAL][
+                            V30PresFormat.Format.INDY.api
+                        ],
+                    ),
+                )
+            ],
+        )
+        record = V30PresExRecord(pres_proposal=pres_proposal)
+
+        by_format = record.by_format
+        assert by_format == {"pres_proposal": {"indy": INDY_PROOF_REQ}}
+        assert record.by_format is by_format
+
+        record.pres_proposal = None  # setter drops memoized result
+        assert record.by_format == {}
+
+    async def test_choices(self):
+        for prefix, choices in (
+            ("INITIATOR_", V30PresExRecord.INITIATORS),
+            ("ROLE_", V30PresExRecord.ROLES),
+            ("STATE_", V30PresExRecord.STATES),
+        ):
+            assert set(choices) == {
+                getattr(V30PresExRecord, m)
+                for m in vars(V30PresExRecord)
+                if m.startswith(prefix)
+            }
+
     async def test_save_error_state(self):
         session = InMemoryProfile.test_session()
         record = V30PresExRecord(state=None)
@@ -83,24 +83,12 @@ class V30PresExRecordListQueryStringSchema(OpenAPISchema):
     role = fields.Str(
         description="Role assigned in presentation exchange",
         required=False,
-        validate=validate.OneOf(
-            [
-                getattr(V30PresExRecord, m)
-                for m in vars(V30PresExRecord)
-                if m.startswith("ROLE_")
-            ]
-        ),
+        validate=validate.OneOf(V30PresExRecord.ROLES),
     )
     state = fields.Str(
         description="Presentation exchange state",
         required=False,
-        validate=validate.OneOf(
-            [
-                getattr(V30PresExRecord, m)
-                for m in vars(V30PresExRecord)
-                if m.startswith("STATE_")
-            ]
-        ),
+        validate=validate.OneOf(V30PresExRecord.STATES),
     )
 
 
@@ -634,6 +634,61 @@ class TestV30PresManager(AsyncTestCase):
         )
         assert ret_px_rec is px_rec
         px_rec.save.assert_called_once()
+        assert px_rec.indy_attachment("pres_proposal") == INDY_PROOF_REQ_NAME
+
+    async def test_create_bound_request_repeated_format(self):
+        indy_attach = AttachDecorator.data_base64(
+            INDY_PROOF_REQ_NAME,
+            ident="indy",
+            format=V30PresFormat(
+                format_=ATTACHMENT_FORMAT[PRES_30_PROPOSAL][
+                    V30PresFormat.Format.INDY.api
+                ],
+            ),
+        )
+        px_rec = V30PresExRecord(
+            pres_proposal=V30PresProposal(
+                body=V30PresBody(),
+                attachments=[indy_attach, indy_attach],
+            ).serialize(),
+            role=V30PresExRecord.ROLE_VERIFIER,
+        )
+        px_rec.save = async_mock.CoroutineMock()
+        (ret_px_rec, pres_req_msg) = await self.manager.create_bound_request(
+            pres_ex_record=px_rec,
+        )
+        assert ret_px_rec is px_rec
+        assert len(pres_req_msg.attachments) == 1
+
+    async def test_create_bound_request_first_indy_attachment(self):
+        indy_format = V30PresFormat(
+            format_=ATTACHMENT_FORMAT[PRES_30_PROPOSAL][V30PresFormat.Format.INDY.api],
+        )
+        other_proof_req = deepcopy(INDY_PROOF_REQ_NAME)
+        other_proof_req["requested_attributes"] = {}
+        px_rec = V30PresExRecord(
+            pres_proposal=V30PresProposal(
+                body=V30PresBody(),
+                attachments=[
+                    AttachDecorator.data_base64(
+                        INDY_PROOF_REQ_NAME, ident="indy-0", format=indy_format
+                    ),
+                    AttachDecorator.data_base64(
+                        other_proof_req, ident="indy-1", format=indy_format
+                    ),
+                ],
+            ).serialize(),
+            role=V30PresExRecord.ROLE_VERIFIER,
+        )
+        px_rec.save = async_mock.CoroutineMock()
+        (_, pres_req_msg) = await self.manager.create_bound_request(
+            pres_ex_record=px_rec,
+        )
+        indy_proof_req = pres_req_msg.attachment(V30PresFormat.Format.INDY)
+        assert (
+            indy_proof_req["requested_attributes"]
+            == INDY_PROOF_REQ_NAME["requested_attributes"]
+        )
 
     async def test_create_bound_request_no_format(self):
         px_rec = V30PresExRecord(
@@ -785,6 +840,25 @@ class TestV30PresManager(AsyncTestCase):
 
             assert px_rec_out.state == V30PresExRecord.STATE_REQUEST_RECEIVED
 
+    async def test_receive_pres_request_in_session(self):
+        px_rec_in = V30PresExRecord()
+        session = async_mock.MagicMock()
+
+        with async_mock.patch.object(
+            V30PresExRecord, "save", autospec=True
+        ) as save_ex, async_mock.patch.object(
+            self.profile, "session", async_mock.MagicMock()
+        ) as mock_session:
+            px_rec_out = await self.manager.receive_pres_request(
+                px_rec_in, session=session
+            )
+            save_ex.assert_called_once_with(
+                px_rec_in, session, reason="receive v3.0 presentation request"
+            )
+            mock_session.assert_not_called()
+
+            assert px_rec_out.state == V30PresExRecord.STATE_REQUEST_RECEIVED
+
     async def test_create_pres_indy(self):
         pres_request = V30PresRequest(
             body=V30PresBody(),
@@ -828,10 +902,12 @@ class TestV30PresManager(AsyncTestCase):
             assert len(req_creds["requested_predicates"]) == 1
 
             (px_rec_out, pres_msg) = await self.manager.create_pres(
-                px_rec_in, request_data
+                px_rec_in, request_data, comment="comment"
             )
             save_ex.assert_called_once()
             assert px_rec_out.state == V30PresExRecord.STATE_PRESENTATION_SENT
+            assert px_rec_out.pres.serialize() == pres_msg.serialize()
+            assert px_rec_out.pres.body.comment == "comment"
 
     async def test_create_pres_indy_and_dif(self):
         pres_request = V30PresRequest(
@@ -1428,6 +1504,12 @@ class TestV30PresManager(AsyncTestCase):
             save_ex.assert_called_once()
             assert px_rec_out.state == (V30PresExRecord.STATE_PRESENTATION_RECEIVED)
 
+            # redelivered presentation changes nothing: no second save
+            retrieve_ex.side_effect = [px_rec_out]
+            save_ex.reset_mock()
+            await self.manager.receive_pres(pres, connection_record, None)
+            save_ex.assert_not_called()
+
     async def test_receive_pres_receive_pred_value_mismatch_punt_to_indy(self):
         connection_record = async_mock.MagicMock(connection_id=CONN_ID)
         pres_proposal = V30PresProposal(
@@ -1508,6 +1590,20 @@ class TestV30PresManager(AsyncTestCase):
             save_ex.assert_called_once()
             assert px_rec_out.state == (V30PresExRecord.STATE_PRESENTATION_RECEIVED)
 
+        # verifier still sees the attribute value restriction left to indy
+        self.profile.context.injector.bind_instance(
+            BaseMultitenantManager,
+            async_mock.MagicMock(MultitenantManager, autospec=True),
+        )
+        with async_mock.patch.object(
+            IndyLedgerRequestsExecutor,
+            "get_ledger_for_identifier",
+            async_mock.CoroutineMock(return_value=("test_ledger_id", self.ledger)),
+        ), async_mock.patch.object(V30PresExRecord, "save", autospec=True):
+            await self.manager.verify_pres(px_rec_out)
+        verified_proof_req = self.verifier.verify_presentation.call_args[0][0]
+        assert verified_proof_req == indy_proof_req
+
     async def test_receive_pres_indy_no_predicate_restrictions(self):
         connection_record = async_mock.MagicMock(connection_id=CONN_ID)
         indy_proof_req = {
@@ -2236,6 +2332,7 @@ class TestV30PresManager(AsyncTestCase):
             save_ex.assert_called_once()
 
             assert px_rec_out.state == (V30PresExRecord.STATE_DONE)
+            assert px_rec_out.verified == "true"
 
     async def test_verify_pres_indy_and_dif(self):
         pres_request = V30PresRequest(
@@ -2332,32 +2429,23 @@ class TestV30PresManager(AsyncTestCase):
             assert px_rec_out.verified == "false"
 
     async def test_send_pres_ack(self):
-        px_rec = V30PresExRecord()
-
         responder = MockResponder()
         self.profile.context.injector.bind_instance(BaseResponder, responder)
 
+        px_rec = V30PresExRecord()
         await self.manager.send_pres_ack(px_rec)
-        messages = responder.messages
-        assert len(messages) == 1
-
-        px_rec = V30PresExRecord(verified="true")
+        assert len(responder.messages) == 1
 
-        responder = MockResponder()
-        self.profile.context.injector.bind_instance(BaseResponder, responder)
+        # manager keeps the responder it injected first
+        self.profile.context.injector.clear_binding(BaseResponder)
 
+        px_rec = V30PresExRecord(verified="true")
         await self.manager.send_pres_ack(px_rec)
-        messages = responder.messages
-        assert len(messages) == 1
+        assert len(responder.messages) == 2
 
         px_rec = V30PresExRecord(verified="false")
-
-        responder = MockResponder()
-        self.profile.context.injector.bind_instance(BaseResponder, responder)
-
         await self.manager.send_pres_ack(px_rec)
-        messages = responder.messages
-        assert len(messages) == 1
+        assert len(responder.messages) == 3
 
     async def test_send_pres_ack_no_responder(self):
         px_rec = V30PresExRecord()
@@ -2386,7 +2474,7 @@ class TestV30PresManager(AsyncTestCase):
         conn_record = async_mock.MagicMock(connection_id=CONN_ID)
 
         px_rec_dummy = V30PresExRecord()
-        message = async_mock.MagicMock(_verification_result="true")
+        message = async_mock.MagicMock(verification_result="true")
 
         with async_mock.patch.object(
             V30PresExRecord, "save", autospec=True
@@ -2425,18 +2513,19 @@ class TestV30PresManager(AsyncTestCase):
             async_mock.CoroutineMock(),
         ) as retrieve_ex, async_mock.patch.object(
             self.profile,
-            "session",
-            async_mock.MagicMock(return_value=self.profile.session()),
-        ) as session:
+            "transaction",
+            async_mock.MagicMock(return_value=self.profile.transaction()),
+        ) as transaction:
             retrieve_ex.return_value = stored_exchange
 
             ret_exchange = await self.manager.receive_problem_report(
                 problem, connection_id
             )
             retrieve_ex.assert_called_once_with(
-                session.return_value,
+                transaction.return_value,
                 {"thread_id": problem._thread_id},
                 {"connection_id": connection_id},
+                for_update=True,
             )
             save_ex.assert_called_once()
 